@@ -1,106 +1,93 @@
-# ==================== Product Classes ====================
-class Product:
-    def __init__(self, product_id, name, price, quantity_available):
-        # Base product initialization
-        self._product_id = product_id
-        self._name = name
-        self._price = price
-        self._quantity_available = quantity_available
-
-    # Read-only properties for encapsulation
-    @property
-    def product_id(self): return self._product_id
+import sys
+import math
+from array import array
 
-    @property
-    def name(self): return self._name
+_PHYSICAL, _DIGITAL = 0, 1  # values of Product._kind
+_TRIE_IDS = '$ids'  # trie node key holding matching product IDs (never a single character)
 
-    @property
-    def price(self): return self._price
+# Write a block of output lines with a single call instead of one print per line
+def _write_lines(lines):
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    @property
-    def quantity_available(self): return self._quantity_available
-
-    # Set quantity with validation
-    @quantity_available.setter
-    def quantity_available(self, value):
-        if value >= 0:
-            self._quantity_available = value
+# ==================== Product Classes ====================
+class Product:
+    # Fixed attribute layout: no per-instance __dict__, plain slot reads.
+    # product_id, name and price must not change after construction: the search trie,
+    # _name_lower, _details_prefix and the cart's line totals are all derived from them.
+    # quantity_available should only change through decrease_quantity/increase_quantity.
+    __slots__ = ('product_id', 'name', 'price', 'quantity_available', '_name_lower', '_details_prefix')
+    _kind = None  # product category tag, set by each subclass
 
-    # Reduce stock if enough quantity is available
+    def __init__(self, product_id, name, price, quantity_available):
+        # Base product initialization
+        self.product_id = product_id
+        self.name = name
+        self.price = price
+        self.quantity_available = quantity_available
+        self._name_lower = name.lower()  # lowercased once for case-insensitive search
+        # Everything in the details line except stock is fixed, so format it once
+        self._details_prefix = f"ID: {product_id}, Name: {name}, Price: ${price}, "
+
+    # Reduce stock if enough quantity is available (both checks combined with a bitwise and)
     def decrease_quantity(self, amount):
-        if 0 < amount <= self._quantity_available:
-            self._quantity_available -= amount
-            return True
-        return False
+        new = self.quantity_available - amount
+        ok = (amount > 0) & (new >= 0)
+        self.quantity_available = new if ok else self.quantity_available
+        return ok
 
     # Increase stock
     def increase_quantity(self, amount):
         if amount > 0:
-            self._quantity_available += amount
+            self.quantity_available += amount
 
     # Display basic product info
     def display_details(self):
-        return f"ID: {self.product_id}, Name: {self.name}, Price: ${self.price}, Stock: {self.quantity_available}"
+        return self._details_prefix + f"Stock: {self.quantity_available}"
 
 # Subclass for physical products with weight
 class PhysicalProduct(Product):
+    __slots__ = ('weight',)
+    _kind = _PHYSICAL
+
     def __init__(self, product_id, name, price, quantity_available, weight):
         super().__init__(product_id, name, price, quantity_available)
-        self._weight = weight
+        self.weight = weight
+        self._details_prefix = "[Physical] " + self._details_prefix
 
     def display_details(self):
-        return (
-            f"[Physical] ID: {self.product_id}, Name: {self.name}, Price: ${self.price}, "
-            f"Stock: {self.quantity_available}, Weight: {self._weight}kg"
-        )
+        return self._details_prefix + f"Stock: {self.quantity_available}, Weight: {self.weight}kg"
 
 # Subclass for digital products with download link
 class DigitalProduct(Product):
+    __slots__ = ('download_link', '_details')
+    _kind = _DIGITAL
+
     def __init__(self, product_id, name, price, quantity_available, download_link):
         super().__init__(product_id, name, price, quantity_available)
-        self._download_link = download_link
+        self.download_link = download_link
+        # Digital details don't show stock, so the whole line is fixed
+        self._details = f"[Digital] {self._details_prefix}Download Link: {download_link}"
 
     def display_details(self):
-        return f"[Digital] ID: {self.product_id}, Name: {self.name}, Price: ${self.price}, Download Link: {self._download_link}"
-
-# ==================== Cart Item Class ====================
-class CartItem:
-    def __init__(self, product, quantity):
-        self._product = product
-        self._quantity = quantity
-
-    @property
-    def product(self): return self._product
-
-    @property
-    def quantity(self): return self._quantity
-
-    @quantity.setter
-    def quantity(self, value):
-        if value >= 0:
-            self._quantity = value
-
-    # Calculate total price for this cart item
-    def calculate_subtotal(self):
-        return self.product.price * self.quantity
-
-    def __str__(self):
-        return (
-            f"Item: {self.product.name}, Quantity: {self.quantity}, "
-            f"Price: ${self.product.price}, Subtotal: ${self.calculate_subtotal():.2f}"
-        )
+        return self._details
 
 # ==================== Shopping Cart Class ====================
 class ShoppingCart:
     TAX_RATE = 0.08  # 8% tax rate
+    _TAX_MULT = 1 + TAX_RATE  # grand total = subtotal * _TAX_MULT
 
     def __init__(self):
-        self._items = {}  # key: product_id, value: CartItem
+        # Cart contents as parallel arrays; slot i describes one product line
+        self._products = []         # Product at slot i
+        self._qty = array('q')      # quantity at slot i
+        self._contrib = array('d')  # price * quantity at slot i
+        self._idx = {}              # key: product_id, value: slot index
+        self._cache = {}  # memoized totals, cleared whenever the cart changes
         self.catalog = self._create_sample_catalog()
 
     # Hardcoded catalog with 10 products
     def _create_sample_catalog(self):
-        return {
+        catalog = {
             "P001": PhysicalProduct("P001", "Laptop", 999.99, 10, 2.5),
             "P002": PhysicalProduct("P002", "Smartphone", 499.99, 20, 0.3),
             "P003": PhysicalProduct("P003", "Headphones", 89.99, 15, 0.2),
@@ -112,6 +99,26 @@ class ShoppingCart:
             "D004": DigitalProduct("D004", "E-book", 14.99, 150, "https://download.com/ebook"),
             "D005": DigitalProduct("D005", "Online Course", 199.99, 50, "https://download.com/course")
         }
+        self._name_trie = self._build_name_trie(catalog)
+        # Group by category once; the catalog never changes after this
+        self._by_kind = {_PHYSICAL: [], _DIGITAL: []}
+        for product in catalog.values():
+            self._by_kind[product._kind].append(product)
+        return catalog
+
+    # Suffix trie over lowercase names: every node lists the products whose name contains its path
+    def _build_name_trie(self, catalog):
+        root = {_TRIE_IDS: []}
+        for product_id, product in catalog.items():
+            root[_TRIE_IDS].append(product_id)
+            for start in range(len(product._name_lower)):
+                node = root
+                for ch in product._name_lower[start:]:
+                    node = node.setdefault(ch, {_TRIE_IDS: []})
+                    ids = node[_TRIE_IDS]
+                    if not ids or ids[-1] != product_id:
+                        ids.append(product_id)
+        return root
 
     # Add a product to cart
     def add_item(self, product_id, quantity):
@@ -126,112 +133,164 @@ class ShoppingCart:
             print(f"❌ Not enough stock. Available: {product.quantity_available}")
             return False
 
-        if product_id in self._items:
-            self._items[product_id].quantity += quantity
+        i = self._idx.get(product_id)
+        if i is not None:
+            self._qty[i] += quantity
+            self._contrib[i] = product.price * self._qty[i]
         else:
-            self._items[product_id] = CartItem(product, quantity)
+            self._idx[product_id] = len(self._products)
+            self._products.append(product)
+            self._qty.append(quantity)
+            self._contrib.append(product.price * quantity)
             print(f"✅ {quantity} x '{product.name}' added to cart.")
 
+        self._invalidate()
         return True
 
     # Remove a product from the cart
     def remove_item(self, product_id):
-        if product_id in self._items:
-            product = self._items[product_id].product
-            product.increase_quantity(self._items[product_id].quantity)
-            del self._items[product_id]
-            print(f"🗑️ Removed '{product.name}' from cart.")
-            return True
-        return False
+        i = self._idx.get(product_id)
+        if i is None:
+            return False
+        product = self._products[i]
+        product.increase_quantity(self._qty[i])
+        self._remove_slot(i)
+        self._invalidate()
+        print(f"🗑️ Removed '{product.name}' from cart.")
+        return True
 
     # Change quantity of a product in the cart
     def update_quantity(self, product_id, new_quantity):
-        if product_id in self._items:
-            item = self._items[product_id]
-            product = item.product
-            diff = new_quantity - item.quantity
-            if diff > 0:
-                if not product.decrease_quantity(diff):
-                    print("❌ Not enough stock.")
-                    return False
-            else:
-                product.increase_quantity(-diff)
-            item.quantity = new_quantity
-            print(f"🔁 Updated '{product.name}' to quantity {new_quantity}.")
-            return True
-        print("❌ Item not found in cart.")
-        return False
+        i = self._idx.get(product_id)
+        if i is None:
+            print("❌ Item not found in cart.")
+            return False
+        # Quantities are plain array slots, so the non-negative check formerly in CartItem lives here
+        if new_quantity < 0:
+            print("❌ Quantity cannot be negative.")
+            return False
+        product = self._products[i]
+        diff = new_quantity - self._qty[i]
+        if diff > 0:
+            if not product.decrease_quantity(diff):
+                print("❌ Not enough stock.")
+                return False
+        else:
+            product.increase_quantity(-diff)
+        self._qty[i] = new_quantity
+        self._contrib[i] = product.price * new_quantity
+        self._invalidate()
+        print(f"🔁 Updated '{product.name}' to quantity {new_quantity}.")
+        return True
+
+    # Remove slot i, shifting later slots down so the cart keeps insertion order
+    def _remove_slot(self, i):
+        del self._idx[self._products[i].product_id]
+        del self._products[i]
+        del self._qty[i]
+        del self._contrib[i]
+        for product in self._products[i:]:
+            self._idx[product.product_id] -= 1
+
+    # Clear every slot
+    def _clear_slots(self):
+        self._products.clear()
+        del self._qty[:]
+        del self._contrib[:]
+        self._idx.clear()
+
+    # One display line per cart slot, built straight from the arrays
+    def _item_lines(self):
+        return [
+            f"Item: {product.name}, Quantity: {quantity}, "
+            f"Price: ${product.price}, Subtotal: ${subtotal:.2f}"
+            for product, quantity, subtotal in zip(self._products, self._qty, self._contrib)
+        ]
+
+    # Drop memoized totals after any change to the cart
+    def _invalidate(self):
+        self._cache.clear()
+
+    # Subtotal, tax and grand total computed together in one pass, then served from the cache
+    def _totals(self):
+        totals = self._cache.get('totals')
+        if totals is None:
+            subtotal = math.fsum(self._contrib)
+            totals = self._cache['totals'] = (subtotal, subtotal * self.TAX_RATE, subtotal * self._TAX_MULT)
+        return totals
 
     # Cart totals
     def get_total(self):
-        return sum(item.calculate_subtotal() for item in self._items.values())
+        return self._totals()[0]
 
     def get_tax(self):
-        return self.get_total() * self.TAX_RATE
+        return self._totals()[1]
 
     def get_grand_total(self):
-        return self.get_total() + self.get_tax()
+        return self._totals()[2]
 
     # Empty all cart items
     def empty_cart(self):
-        for item in list(self._items.values()):
-            item.product.increase_quantity(item.quantity)
-        self._items.clear()
+        for product, quantity in zip(self._products, self._qty):
+            product.increase_quantity(quantity)
+        self._clear_slots()
+        self._invalidate()
         print("🧹 Cart emptied.")
 
     # Display contents of cart
     def display_cart(self):
-        print("\n🛒 --- Shopping Cart ---")
-        if not self._items:
-            print("Cart is empty.")
-        for item in self._items.values():
-            print(item)
-        print(f"Subtotal: ${self.get_total():.2f}")
-        print(f"Tax (8%): ${self.get_tax():.2f}")
-        print(f"Total: ${self.get_grand_total():.2f}\n")
+        lines = ["\n🛒 --- Shopping Cart ---"]
+        if not self._idx:
+            lines.append("Cart is empty.")
+        lines.extend(self._item_lines())
+        subtotal, tax, grand_total = self._totals()
+        lines.append(f"Subtotal: ${subtotal:.2f}")
+        lines.append(f"Tax (8%): ${tax:.2f}")
+        lines.append(f"Total: ${grand_total:.2f}\n")
+        _write_lines(lines)
 
     # Print available products by type
     def display_products(self):
-        print("\n📦 --- Physical Products ---")
-        for product in self.catalog.values():
-            if isinstance(product, PhysicalProduct):
-                print(product.display_details())
-        print("\n💻 --- Digital Products ---")
-        for product in self.catalog.values():
-            if isinstance(product, DigitalProduct):
-                print(product.display_details())
-        print("")
+        lines = ["\n📦 --- Physical Products ---"]
+        lines.extend(product.display_details() for product in self._by_kind[_PHYSICAL])
+        lines.append("\n💻 --- Digital Products ---")
+        lines.extend(product.display_details() for product in self._by_kind[_DIGITAL])
+        lines.append("")
+        _write_lines(lines)
 
     # Search for products
     def search_products(self, keyword):
-        print(f"\n🔍 Search Results for '{keyword}':")
-        found = False
-        for product in self.catalog.values():
-            if keyword.lower() in product.name.lower():
-                print(product.display_details())
-                found = True
-        if not found:
-            print("No products found.")
+        node = self._name_trie
+        for ch in keyword.lower():
+            node = node.get(ch)
+            if node is None:
+                break
+        matches = node[_TRIE_IDS] if node else []
+        lines = [f"\n🔍 Search Results for '{keyword}':"]
+        lines.extend(self.catalog[product_id].display_details() for product_id in matches)
+        if not matches:
+            lines.append("No products found.")
+        _write_lines(lines)
 
     # Print final checkout summary
     def checkout(self):
-        print("\n🧾 --- Checkout Summary ---")
-        if not self._items:
-            print("Cart is empty. Nothing to checkout.")
+        lines = ["\n🧾 --- Checkout Summary ---"]
+        if not self._idx:
+            lines.append("Cart is empty. Nothing to checkout.")
+            _write_lines(lines)
             return
-        for item in self._items.values():
-            print(item)
-        print(f"Subtotal: ${self.get_total():.2f}")
-        print(f"Tax: ${self.get_tax():.2f}")
-        print(f"Grand Total: ${self.get_grand_total():.2f}")
-        print("✅ Thank you for your purchase!")
-        self._items.clear()
+        lines.extend(self._item_lines())
+        subtotal, tax, grand_total = self._totals()
+        lines.append(f"Subtotal: ${subtotal:.2f}")
+        lines.append(f"Tax: ${tax:.2f}")
+        lines.append(f"Grand Total: ${grand_total:.2f}")
+        lines.append("✅ Thank you for your purchase!")
+        _write_lines(lines)
+        self._clear_slots()
+        self._invalidate()
 
 # ==================== Console Interface ====================
-def main():
-    cart = ShoppingCart()
-    while True:
-        print("""
+MENU = """
 1. View All Products
 2. Search Product by Name
 3. Add to Cart
@@ -241,44 +300,64 @@ def main():
 7. Empty Cart
 8. Checkout
 9. Exit
-        """)
+?. Show this menu
+        """
+
+# Menu actions; a handler returns True to end the session
+def _search(cart):
+    keyword = input("Enter keyword to search: ")
+    cart.search_products(keyword)
+
+def _add(cart):
+    pid = input("Enter product ID: ")
+    try:
+        qty = int(input("Enter quantity: "))
+        if not cart.add_item(pid, qty):
+            print("❌ Failed to add item.")
+    except ValueError:
+        print("❌ Invalid quantity.")
+
+def _update(cart):
+    pid = input("Enter product ID to update: ")
+    try:
+        qty = int(input("Enter new quantity: "))
+        if not cart.update_quantity(pid, qty):
+            print("❌ Update failed.")
+    except ValueError:
+        print("❌ Invalid quantity.")
+
+def _remove(cart):
+    pid = input("Enter product ID to remove: ")
+    if not cart.remove_item(pid):
+        print("❌ Product not found in cart.")
+
+def _exit(cart):
+    print("👋 Thank you! Exiting...")
+    return True
+
+def _invalid(cart):
+    print("❌ Invalid choice.")
+
+HANDLERS = {
+    '1': lambda cart: cart.display_products(),
+    '2': _search,
+    '3': _add,
+    '4': lambda cart: cart.display_cart(),
+    '5': _update,
+    '6': _remove,
+    '7': lambda cart: cart.empty_cart(),
+    '8': lambda cart: cart.checkout(),
+    '9': _exit,
+    '?': lambda cart: print(MENU),
+}
+
+def main():
+    cart = ShoppingCart()
+    print(MENU)
+    while True:
         choice = input("Select an option: ")
-        if choice == '1':
-            cart.display_products()
-        elif choice == '2':
-            keyword = input("Enter keyword to search: ")
-            cart.search_products(keyword)
-        elif choice == '3':
-            pid = input("Enter product ID: ")
-            try:
-                qty = int(input("Enter quantity: "))
-                if not cart.add_item(pid, qty):
-                    print("❌ Failed to add item.")
-            except ValueError:
-                print("❌ Invalid quantity.")
-        elif choice == '4':
-            cart.display_cart()
-        elif choice == '5':
-            pid = input("Enter product ID to update: ")
-            try:
-                qty = int(input("Enter new quantity: "))
-                if not cart.update_quantity(pid, qty):
-                    print("❌ Update failed.")
-            except ValueError:
-                print("❌ Invalid quantity.")
-        elif choice == '6':
-            pid = input("Enter product ID to remove: ")
-            if not cart.remove_item(pid):
-                print("❌ Product not found in cart.")
-        elif choice == '7':
-            cart.empty_cart()
-        elif choice == '8':
-            cart.checkout()
-        elif choice == '9':
-            print("👋 Thank you! Exiting...")
+        if HANDLERS.get(choice, _invalid)(cart):
             break
-        else:
-            print("❌ Invalid choice.")
 
 if __name__ == '__main__':
     main()